@@ -2,7 +2,10 @@
 from enum import Enum
 import numpy as np
 import inspect
-from typing import Dict, Set, List, Union, Callable, Any, Tuple
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Set, FrozenSet, List, Union, Callable, Any, Tuple
 import logging
 
 
@@ -15,20 +18,72 @@ except ImportError:
     pass
 
 
-class Shape(np.vectorize):
+numba_enable = False
+try:
+    import numba
+
+    numba_enable = True
+except ImportError:
+    pass
+
+
+# Identifiers of the shapes known to the compiled rendering kernel.
+# Shapes without such an identifier are evaluated by numpy and passed to the kernel as samples.
+SHAPE_CUSTOM = -1
+SHAPE_ZERO = 0
+SHAPE_RECT = 1
+SHAPE_GAUSS = 2
+SHAPE_RAMP = 3
+SHAPE_SQRFCT = 4
+
+# Inverse width of the gaussian shape (sigma = 0.166 on the standardized interval)
+_GAUSS_INV_SIGMA = 1.0 / 0.166
+
+# Number of samples after which the compiled kernel recalculates the IQ carrier exactly
+_CARRIER_RESYNC = 1024
+
+# Maximum total size (in bytes) of the evaluated shapes kept by each PulseSequence
+_SHAPE_CACHE_BYTES = 32 * 1024 ** 2
+
+# Placeholder for the shape samples of shapes evaluated inside the compiled kernel
+_NO_SAMPLES = np.zeros(0)
+
+# Columns (and their dtypes) of the table in which PulseSequence stores the properties of its pulses
+_PULSE_TABLE_COLUMNS: Dict[str, type] = {
+    "shape_id": np.int64,
+    "parallel": np.bool_,  # True if the pulse starts together with the previous one
+    "iq_frequency": np.float64,
+    "phase": np.float64,  # in rad
+    "iq_angle": np.float64,
+    "q_rel": np.float64,
+    "iq_dc_offset_re": np.float64,
+    "iq_dc_offset_im": np.float64,
+}
+
+
+class Shape(object):
     """
-    A vectorized function describing a possible shape
+    A function describing a possible shape
     defined on the standardized interval [0,1).
+    The function has to operate on whole numpy arrays, i.e. map an ndarray of time fractions
+    onto an ndarray of the same size (or a value which is broadcast to that size, i.e. a constant).
+    Functions are no longer wrapped in np.vectorize: shapes which only work on single floats
+    (i.e. lambda x: 1 if x < .5 else 0) have to be written with numpy, i.e. lambda x: np.where(x < .5, 1., 0.).
     """
 
-    def __init__(
-        self, name: str, func: Callable[[float], float], *args: Any, **kwargs: Any
-    ):
+    def __init__(self, name: str, func: Callable[[np.ndarray], np.ndarray]):
         self.name = name
-        super(Shape, self).__init__(func, *args, **kwargs)
+        self.func = func
+        # Only the shapes of ShapeLib are evaluated inside the compiled kernel
+        self._kernel_id = SHAPE_CUSTOM
+
+    def __call__(self, x: Union[float, np.ndarray]) -> np.ndarray:
+        x = np.asarray(x, dtype=float)
+        # Constant shapes return a scalar, the result is a read-only view in any case
+        return np.broadcast_to(np.asarray(self.func(x), dtype=float), x.shape)
 
     def __mul__(self, other):
-        return Shape(self.name, lambda x: self.pyfunc(x) * other.pyfunc(x))
+        return Shape(self.name, lambda x, f=self.func, g=other.func: f(x) * g(x))
 
 
 class ShapeLibClass(object):
@@ -38,20 +93,331 @@ class ShapeLibClass(object):
     """
 
     def __init__(self):
-        self.zero = Shape("", lambda x: 0)
-        self.rect = Shape("rect", lambda x: np.where(x >= 0 and x < 1, 1, 0))
-        self.gauss = (
-            Shape("gauss", lambda x: np.exp(-0.5 * np.power((x - 0.5) / 0.166, 2.0)))
-            * self.rect
-        )
-        self.ramp = Shape("ramp", lambda x: x) * self.rect
-        self.sqrfct = Shape("sqrfct", lambda x: x ** 2) * self.rect
+        def builtin(name: str, func: Callable, kernel_id: int) -> Shape:
+            shape = Shape(name, func)
+            shape._kernel_id = kernel_id
+            return shape
+
+        def rect(x):
+            return ((x >= 0) & (x < 1)).astype(float)
+
+        def gauss(x):
+            # exp(-0.5 * ((x - 0.5) / sigma)**2) with a multiplication instead of the generic power
+            # asarray keeps the in-place operations working for scalar input
+            d = np.asarray(x - 0.5, dtype=float)
+            d *= _GAUSS_INV_SIGMA
+            d *= d
+            d *= -0.5
+            np.exp(d, out=d)
+            d *= rect(x)
+            return d
+
+        self.zero = builtin("", lambda x: np.zeros_like(x, dtype=float), SHAPE_ZERO)
+        self.rect = builtin("rect", rect, SHAPE_RECT)
+        self.gauss = builtin("gauss", gauss, SHAPE_GAUSS)
+        self.ramp = builtin("ramp", lambda x: x * rect(x), SHAPE_RAMP)
+        self.sqrfct = builtin("sqrfct", lambda x: x ** 2 * rect(x), SHAPE_SQRFCT)
 
 
 # Make ShapeLib a singleton:
 ShapeLib = ShapeLibClass()
 
 
+if numba_enable:
+
+    @numba.njit(cache=True, fastmath=True, nogil=True)
+    def _render_pulse(
+        out_i,
+        out_q,
+        start,
+        length_n,
+        shape_id,
+        samples,
+        amp,
+        length,
+        dt,
+        mixing,
+        iq_freq,
+        phase,
+        iq_angle,
+        q_rel,
+        iq_dc_offset_re,
+        iq_dc_offset_im,
+    ):
+        """
+        Adds a single pulse of length_n samples starting at index start to the I and Q arrays out_i and out_q.
+        The shape is calculated on the fly for known shape ids, otherwise the precalculated samples are used.
+        If mixing is True, the pulse is IQ-modulated with iq_freq and calibrated with iq_angle, q_rel and iq_dc_offset.
+        Phases are given in rad.
+        """
+        angle = np.pi / 180.0 * (90.0 - iq_angle)
+        correct = iq_angle != 90.0 or q_rel != 1.0
+        cos_angle = np.cos(angle)
+        sin_angle = np.sin(angle)
+        # The carrier is advanced by a rotation of one timestep per sample instead of evaluating cos and sin.
+        # It is recalculated exactly every _CARRIER_RESYNC samples to bound the accumulated rounding error.
+        two_pi_f_dt = 2.0 * np.pi * iq_freq * dt
+        cos_step = np.cos(two_pi_f_dt)
+        sin_step = np.sin(two_pi_f_dt)
+        c = 1.0
+        s = 0.0
+        # The time fractions are calculated from the sample index, no time arrays are needed
+        frac_step = dt / length
+        for i in range(length_n):
+            # time fractions are within [0,1) by construction of length_n
+            frac = i * frac_step
+            if shape_id == SHAPE_ZERO:
+                value = 0.0
+            elif shape_id == SHAPE_RECT:
+                value = 1.0
+            elif shape_id == SHAPE_GAUSS:
+                d = (frac - 0.5) * _GAUSS_INV_SIGMA
+                value = np.exp(-0.5 * d * d)
+            elif shape_id == SHAPE_RAMP:
+                value = frac
+            elif shape_id == SHAPE_SQRFCT:
+                value = frac * frac
+            else:
+                value = samples[i]
+            value *= amp
+            if not mixing:
+                out_i[start + i] += value
+                continue
+            if i % _CARRIER_RESYNC == 0:
+                theta = two_pi_f_dt * (start + i) - phase
+                c = np.cos(theta)
+                s = np.sin(theta)
+            else:
+                c, s = c * cos_step - s * sin_step, s * cos_step + c * sin_step
+            env_i = value * c
+            if correct:
+                env_q = q_rel * value * (s * cos_angle + c * sin_angle)
+            else:
+                env_q = value * s
+            out_i[start + i] += env_i + iq_dc_offset_re
+            out_q[start + i] += env_q + iq_dc_offset_im
+
+    @numba.njit(cache=True, nogil=True)
+    def _render_row(
+        out_i,
+        out_q,
+        starts,
+        sample_counts,
+        lengths,
+        amplitudes,
+        shape_offsets,
+        shape_data,
+        shape_ids,
+        mixing,
+        iq_freqs,
+        phases,
+        iq_angles,
+        q_rels,
+        iq_dc_offsets_re,
+        iq_dc_offsets_im,
+        dt,
+        dc_corr_re,
+        dc_corr_im,
+    ):
+        """
+        Renders all pulses of one sequence into out_i and out_q, which hold exactly the samples of the sequence.
+        All arguments except the output arrays, dt and dc_corr are 1D arrays with one entry per pulse.
+        Pulses with zero samples are skipped.
+        """
+        for j in range(shape_ids.size):
+            n = sample_counts[j]
+            if n == 0:
+                continue
+            offset = shape_offsets[j]
+            _render_pulse(
+                out_i,
+                out_q,
+                starts[j],
+                n,
+                shape_ids[j],
+                shape_data[offset : offset + n],
+                amplitudes[j],
+                lengths[j],
+                dt,
+                mixing[j],
+                iq_freqs[j],
+                phases[j],
+                iq_angles[j],
+                q_rels[j],
+                iq_dc_offsets_re[j],
+                iq_dc_offsets_im[j],
+            )
+        out_i += dc_corr_re
+        out_q += dc_corr_im
+
+    @numba.njit(cache=True, parallel=True)
+    def _render_batch(
+        out_i,
+        out_q,
+        starts,
+        sample_counts,
+        lengths,
+        amplitudes,
+        shape_offsets,
+        shape_data,
+        total_lengths,
+        shape_ids,
+        mixing,
+        iq_freqs,
+        phases,
+        iq_angles,
+        q_rels,
+        iq_dc_offsets_re,
+        iq_dc_offsets_im,
+        dt,
+        dc_corr_re,
+        dc_corr_im,
+    ):
+        """
+        Renders one sequence per row of out_i and out_q in parallel.
+        Per-pulse properties are 1D arrays, the resolved starts, sample counts, lengths, amplitudes
+        and offsets into shape_data (for custom shapes) are 2D arrays of shape (rows, pulses).
+        """
+        for k in numba.prange(out_i.shape[0]):
+            _render_row(
+                out_i[k, 1 : total_lengths[k] + 1],
+                out_q[k, 1 : total_lengths[k] + 1],
+                starts[k],
+                sample_counts[k],
+                lengths[k],
+                amplitudes[k],
+                shape_offsets[k],
+                shape_data,
+                shape_ids,
+                mixing,
+                iq_freqs,
+                phases,
+                iq_angles,
+                q_rels,
+                iq_dc_offsets_re,
+                iq_dc_offsets_im,
+                dt,
+                dc_corr_re,
+                dc_corr_im,
+            )
+
+
+_ramp_buffer = np.arange(1024, dtype=np.float64)
+_ramp_buffer.flags.writeable = False
+
+
+def _ramp(samples: int) -> np.ndarray:
+    """
+    Returns [0, 1, ..., samples - 1] as read-only view into a shared buffer.
+    The buffer grows as needed, such that the ramp does not have to be allocated for every pulse.
+    """
+    global _ramp_buffer
+    ramp = _ramp_buffer
+    if ramp.size < samples:
+        ramp = np.arange(max(samples, 2 * ramp.size), dtype=np.float64)
+        ramp.flags.writeable = False
+        _ramp_buffer = ramp
+    return ramp[:samples]
+
+
+# Scratch arrays of each thread, reused for the intermediate results of the IQ modulation
+_scratch = threading.local()
+
+
+def _scratch_buffer(name: str, samples: int, dtype: type = np.float64) -> np.ndarray:
+    """
+    Returns an array of the given size from a buffer of the current thread, which is reused by all pulses.
+    Its content is undefined and it is only valid until the next call with the same name and dtype.
+    """
+    buffers = getattr(_scratch, "buffers", None)
+    if buffers is None:
+        buffers = _scratch.buffers = {}
+    key = (name, np.dtype(dtype))
+    buffer = buffers.get(key)
+    if buffer is None or buffer.size < samples:
+        size = max(samples, 1024) if buffer is None else max(samples, 2 * buffer.size)
+        buffer = buffers[key] = np.empty(size, dtype=dtype)
+    return buffer[:samples]
+
+
+def _time_fractions(samples: int, length: float, timestep: float) -> np.ndarray:
+    """Returns the times of the samples of a pulse with the given length as fractions of its length."""
+    # This is a new array, as shape functions may return (and PulseSequence would cache) their input
+    fractions = _ramp(samples) * timestep
+    fractions /= length
+    return fractions
+
+
+def _add_modulated(
+    envelope: np.ndarray,
+    timestep: float,
+    start_phase: float,
+    iq_frequency: float,
+    phase: float,
+    iq_angle: float,
+    q_rel: float,
+    iq_dc_offset: complex,
+    out_i: np.ndarray,
+    out_q: np.ndarray,
+):
+    """
+    Adds the IQ modulated envelope to out_i and out_q (see Pulse.add_modulated).
+    Phases are given in rad, iq_angle in deg.
+    """
+    # All steps work in place on the scratch buffers theta and carrier to avoid temporary arrays
+    theta = np.multiply(
+        _ramp(envelope.size),
+        2 * np.pi * iq_frequency * timestep,
+        out=_scratch_buffer("theta", envelope.size),
+    )
+    theta += start_phase - phase
+    # The carrier uses the precision of the output, the phase is always calculated with double precision
+    carrier = _scratch_buffer("carrier", envelope.size, out_i.dtype)
+    np.cos(theta, out=carrier)
+    np.multiply(carrier, envelope, out=carrier)
+    out_i += carrier
+
+    # account for mixer calibration i.e. dc offset and phase != 90deg between I and Q
+    # Q = q_rel * Im(exp(1j*(theta + angle))) = q_rel * sin(theta + angle)
+    if iq_angle != 90:
+        theta += np.pi / 180 * (90 - iq_angle)
+    np.sin(theta, out=carrier)
+    np.multiply(carrier, envelope, out=carrier)
+    if q_rel != 1.0:
+        carrier *= q_rel
+    out_q += carrier
+
+    # The dc offset applies to the whole duration of the pulse
+    out_i += iq_dc_offset.real
+    out_q += iq_dc_offset.imag
+
+
+def _combine_iq(waveform_i: np.ndarray, waveform_q: np.ndarray) -> np.ndarray:
+    """Returns I + 1j*Q in the precision of the inputs or only I if there is no complex information."""
+    if not np.any(waveform_q):
+        return waveform_i
+    waveform = np.empty(
+        waveform_i.shape, dtype=np.result_type(waveform_i.dtype, np.complex64)
+    )
+    waveform.real = waveform_i
+    waveform.imag = waveform_q
+    return waveform
+
+
+def _stack_waveforms(
+    waveforms: List[Tuple[np.ndarray, np.ndarray, int]], dtype: type
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Stacks the I and Q waveforms of several sweep points into 2D arrays, padding shorter ones with zeros."""
+    max_length = max(len(waveform[0]) for waveform in waveforms)
+    waveform_i = np.zeros((len(waveforms), max_length), dtype=dtype)
+    waveform_q = np.zeros((len(waveforms), max_length), dtype=dtype)
+    for k, (row_i, row_q, _) in enumerate(waveforms):
+        waveform_i[k, : len(row_i)] = row_i
+        waveform_q[k, : len(row_q)] = row_q
+    readout_indices = np.array([waveform[2] for waveform in waveforms])
+    return _combine_iq(waveform_i, waveform_q), readout_indices
+
+
 class PulseType(Enum):
     """Type of Pulse object"""
 
@@ -74,17 +440,21 @@ class ParametrizedValue:
             value = float(value)
         self.name = name
         self.value = value
-        self._variables: Set[str] = set()
+        # The argument names are determined once here, as introspection is far too slow for every call
+        self._variables: FrozenSet[str] = frozenset()
         if callable(value):
-            self._variables.update(inspect.getfullargspec(self.value).args)
+            self._variables = frozenset(
+                name
+                for name, parameter in inspect.signature(value).parameters.items()
+                if parameter.kind
+                not in (inspect.Parameter.VAR_POSITIONAL, inspect.Parameter.VAR_KEYWORD)
+            )
 
     def __call__(self, **kwargs: Any) -> float:
         if self.is_parametrized:
-            useful_variables: Dict = {}
-            for key, value in kwargs.items():
-                if key in self.variables:
-                    useful_variables[key] = value
-            return self.value(**useful_variables)
+            return self.value(
+                **{key: kwargs[key] for key in self._variables if key in kwargs}
+            )
         else:
             return self.value
 
@@ -135,7 +505,7 @@ class ParametrizedValue:
                 )
 
     @property
-    def variables(self) -> Set[str]:
+    def variables(self) -> FrozenSet[str]:
         return self._variables
 
     @property
@@ -209,6 +579,79 @@ class Pulse(object):
         amplitude = self.amplitude(**variables)
         timestep = 1.0 / samplerate
 
+        samples = self.sample_count(length, timestep)
+        if samples == 0:
+            return np.zeros(0)
+
+        envelope = amplitude * self.shape(_time_fractions(samples, length, timestep))
+        return self.modulate(envelope, timestep, heterodyne, start_phase)
+
+    def modulate(
+        self,
+        envelope: np.ndarray,
+        timestep: float,
+        heterodyne: bool = False,
+        start_phase: float = 0,
+    ) -> np.ndarray:
+        """
+        Applies the IQ modulation and mixer calibration of this pulse to a given (real) envelope.
+
+        Args:
+            envelope:    samples of the pulse envelope (including the amplitude)
+            timestep:    time between two samples
+            heterodyne:  Bool if True returns a complex envelope (defaults to False)
+            start_phase: the global phase at which the pulse should start (in rad, defaults to 0)
+
+        Returns:
+            envelope of the pulse as numpy array.
+        """
+        # Empty envelope needs no IQ modulation and
+        # for homodyne mixing the envelope is real
+        if not heterodyne or envelope.size == 0 or self.iq_frequency == 0:
+            return envelope
+
+        modulated = np.zeros(envelope.size, dtype=np.complex128)
+        self.add_modulated(
+            envelope, timestep, start_phase, modulated.real, modulated.imag
+        )
+        return modulated
+
+    def add_modulated(
+        self,
+        envelope: np.ndarray,
+        timestep: float,
+        start_phase: float,
+        out_i: np.ndarray,
+        out_q: np.ndarray,
+    ):
+        """
+        Adds the IQ modulated envelope including the mixer calibration to the separate I and Q arrays out_i and out_q.
+
+        Args:
+            envelope:    samples of the pulse envelope (including the amplitude)
+            timestep:    time between two samples
+            start_phase: the global phase at which the pulse should start (in rad)
+            out_i:       array with the same size as envelope, I is added in place
+            out_q:       array with the same size as envelope, Q is added in place
+        """
+        _add_modulated(
+            envelope,
+            timestep,
+            start_phase,
+            self.iq_frequency,
+            np.pi / 180 * self.phase,
+            self.iq_angle,
+            self.q_rel,
+            complex(self.iq_dc_offset),
+            out_i,
+            out_q,
+        )
+
+    def sample_count(self, length: float, timestep: float) -> int:
+        """
+        Returns the number of samples of the pulse with the given length (as returned by self.length) for a given timestep.
+        Pulses shorter than half a timestep are omitted and have zero samples.
+        """
         if length < timestep / 2.0:
             if length != 0:
                 logging.warning(
@@ -216,43 +659,14 @@ class Pulse(object):
                         self.name, timestep / 2.0 * 1e9
                     )
                 )
+            return 0
 
-            return np.zeros(0)
-
-        time = np.arange(0, length, timestep)
-        time_fractions = time / length
-
-        if time_fractions[-1] >= 1.0:
+        samples = int(np.ceil(length / timestep))
+        if (samples - 1) * timestep / length >= 1.0:
             # This can happen due to float rounding error -> cut it away
             # (the shapes are only defined on [0,1) where 1 is not included)
-            time = time[:-1]
-            time_fractions = time_fractions[:-1]
-
-        envelope = amplitude * self.shape(time_fractions)
-        if not heterodyne or envelope.size == 0 or self.iq_frequency == 0:
-            return envelope
-        # Empty envelope needs no IQ modulation and
-        # for homodyne mixing the envelope is real
-        else:
-            envelope = envelope * np.exp(
-                1.0j
-                * (
-                    start_phase
-                    - np.pi / 180 * self.phase
-                    + 2 * np.pi * self.iq_frequency * time
-                )
-            )
-
-        # account for mixer calibration i.e. dc offset and phase != 90deg between I and Q
-        if self.iq_angle != 90 or self.q_rel != 1.0:
-            envelope_i = np.real(envelope)
-            envelope_q = self.q_rel * np.imag(
-                envelope * np.exp(1.0j * np.pi / 180 * (90 - self.iq_angle))
-            )
-            envelope = envelope_i + 1.0j * envelope_q
-        envelope[envelope != 0] += self.iq_dc_offset
-
-        return envelope
+            samples -= 1
+        return samples
 
     @property
     def variable_names(self) -> Set[str]:
@@ -292,10 +706,34 @@ class PulseSequence(object):
                         The real part encodes the dc offset of I, the imaginary part is the dc offset of Q.
                         This correction is added to the dc offset during the pulse (i.e. of the pulse object).
         """
-        self._sequence: List[List[Pulse]] = []
+        # All pulses in the order they were added, the time slices are marked by the column "parallel" of the pulse table
+        self._pulse_list: List[Pulse] = []
+        # The properties of all pulses in the order of the sequence, stored column-wise in contiguous arrays.
+        # Only the first self._pulse_count rows are valid, the arrays grow geometrically.
+        self._pulse_table: Dict[str, np.ndarray] = {
+            column: np.zeros(8, dtype=dtype)
+            for column, dtype in _PULSE_TABLE_COLUMNS.items()
+        }
+        self._pulse_count = 0
+        # The pulse properties each row of the pulse table was written from, to detect later changes of the pulses
+        self._row_properties: List[Tuple] = []
         self._next_pulse_is_parallel = False
         self._pulses: Dict[str, Pulse] = {}
+        # Evaluated shapes of pulses with fixed length, keyed by (shape, number of samples, length, timestep)
+        self._shape_cache: Dict[Tuple[Shape, int, float, float], np.ndarray] = {}
+        self._shape_cache_bytes = 0
+        # Guards changes of the caches, as sequences may be rendered from several threads
+        self._cache_lock = threading.Lock()
+        # Rendered pulses with fixed length and amplitude as ((start, samples, length, amplitude), I, Q),
+        # keyed by (row in the pulse table, IQ mixing, timestep, dtype)
+        self._pulse_cache: Dict[
+            Tuple[int, bool, float, np.dtype],
+            Tuple[Tuple[int, int, float, float], np.ndarray, np.ndarray],
+        ] = {}
         self._variables: Set[str] = set()
+        # Counters for the automatically generated names of wait and readout pulses
+        self._wait_count = 0
+        self._readout_count = 0
         self._sample = sample
         self.dc_corr: float = dc_corr
         try:
@@ -325,11 +763,25 @@ class PulseSequence(object):
             PulseType.Wait: "w",
         }
 
+    def __getstate__(self) -> Dict[str, Any]:
+        # Locks cannot be copied, the caches are cleared instead of being copied along
+        state = self.__dict__.copy()
+        del state["_cache_lock"]
+        state["_shape_cache"] = {}
+        state["_shape_cache_bytes"] = 0
+        state["_pulse_cache"] = {}
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]):
+        self.__dict__.update(state)
+        self._cache_lock = threading.Lock()
+
     def __call__(
         self,
         IQ_mixing: bool = False,
         include_readout: bool = False,
         samplerate: float = None,
+        dtype: type = np.float64,
         **variables: Any
     ) -> Union[Tuple[np.ndarray, int], None]:
         """
@@ -340,6 +792,7 @@ class PulseSequence(object):
         Args:
             IQ_mixing:   returns complex valued sequence if IQ_mixing is True (real part encodes I, imaginary part encodes Q)
             include_readout:   If the readout pulse should be included in the resulting waveform
+            dtype:       np.float64 (default) or np.float32 for AWGs with single precision input
             **variables:    function arguments for time dependent pulse lengths/wait times. Parameter names need to match time function parameters.
 
 
@@ -347,7 +800,35 @@ class PulseSequence(object):
             waveform:      numpy array of the squence envelope, if IQ_mixing is True real part is I, imaginary part is Q
             readout_index: index of the readout tone
         """
+        waveforms = self.get_iq_waveforms(
+            IQ_mixing=IQ_mixing,
+            include_readout=include_readout,
+            samplerate=samplerate,
+            dtype=dtype,
+            **variables
+        )
+        if waveforms is None:
+            return None
+        waveform_i, waveform_q, readout_index = waveforms
+        return _combine_iq(waveform_i, waveform_q), readout_index
+
+    def get_iq_waveforms(
+        self,
+        IQ_mixing: bool = False,
+        include_readout: bool = False,
+        samplerate: float = None,
+        dtype: type = np.float64,
+        **variables: Any
+    ) -> Union[Tuple[np.ndarray, np.ndarray, int], None]:
+        """
+        Returns the envelope of the whole pulse sequence as separate real arrays for I and Q.
+        Arguments are the same as for calling the sequence.
 
+        Returns:
+            waveform_i:    numpy array of the sequence envelope (of I if IQ_mixing is True)
+            waveform_q:    numpy array of Q (only nonzero if IQ_mixing is True or dc_corr is complex)
+            readout_index: index of the readout tone
+        """
         if self._variables and self._variables != set(variables.keys()):
             logging.error(
                 "Given function arguments do not match with required ones. "
@@ -358,82 +839,485 @@ class PulseSequence(object):
             return None
 
         samplerate = samplerate or self.samplerate
-        if not samplerate:
-            logging.error("Sequence call requires samplerate.")
+        if not self._check_render_options(samplerate, dtype):
             return None
+        self._update_pulse_table()
+
+        return self._render_point(
+            variables, IQ_mixing, include_readout, 1.0 / samplerate, dtype
+        )
+
+    def render_sweep(
+        self,
+        IQ_mixing: bool = False,
+        include_readout: bool = False,
+        samplerate: float = None,
+        dtype: type = np.float64,
+        **variables: List[float]
+    ) -> Union[Tuple[np.ndarray, np.ndarray], None]:
+        """
+        Returns the envelopes of the sequence for a whole sweep of its variables at once.
+        If numba is available, all sweep points are rendered in parallel.
+
+        Args:
+            IQ_mixing:       returns complex valued sequences if IQ_mixing is True (real part encodes I, imaginary part encodes Q)
+            include_readout: If the readout pulse should be included in the resulting waveforms
+            samplerate:      Samplerate of your device (defaults to the samplerate of the sequence)
+            dtype:           np.float64 (default) or np.float32
+            **variables:     One or multiple keywords matching the variable names of the sequence and each containing a list of values.
+                             All lists need to have the same length.
+
+        Returns:
+            waveforms:        2D numpy array with one sequence envelope per row.
+                              Shorter sequences are padded with zeros at the end.
+            readout_indices:  numpy array with the index of the readout tone in each row
+        """
+        sweep_points = self._sweep_points(variables)
+        samplerate = samplerate or self.samplerate
+        if sweep_points is None or not self._check_render_options(samplerate, dtype):
+            return None
+        self._update_pulse_table()
+
+        if numba_enable:
+            waveform_i, waveform_q, readout_indices = self._render_sweep_compiled(
+                sweep_points, IQ_mixing, include_readout, 1.0 / samplerate, dtype
+            )
+            return _combine_iq(waveform_i, waveform_q), readout_indices
+
+        waveforms = [
+            self._render_point(
+                point, IQ_mixing, include_readout, 1.0 / samplerate, dtype
+            )
+            for point in sweep_points
+        ]
+        return _stack_waveforms(waveforms, dtype)
+
+    def render_sweep_threaded(
+        self,
+        IQ_mixing: bool = False,
+        include_readout: bool = False,
+        samplerate: float = None,
+        dtype: type = np.float64,
+        max_workers: int = None,
+        **variables: List[float]
+    ) -> Union[Tuple[np.ndarray, np.ndarray], None]:
+        """
+        Returns the envelopes of the sequence for a whole sweep of its variables like render_sweep,
+        but distributes the sweep points over a pool of threads.
+        This does not require numba, as numpy releases the GIL during the array operations.
+        With numba, each sweep point is rendered by the serial compiled kernel, which runs without the GIL as well,
+        but render_sweep is usually faster in this case.
+
+        Args:
+            max_workers: number of threads, defaults to the number of CPUs
+            all other arguments are the same as for render_sweep
+
+        Returns:
+            waveforms:        2D numpy array with one sequence envelope per row.
+                              Shorter sequences are padded with zeros at the end.
+            readout_indices:  numpy array with the index of the readout tone in each row
+        """
+        sweep_points = self._sweep_points(variables)
+        samplerate = samplerate or self.samplerate
+        if sweep_points is None or not self._check_render_options(samplerate, dtype):
+            return None
+        # Update the table once here, the workers skip the validation and only read it
+        self._update_pulse_table()
+
+        with ThreadPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+            waveforms = list(
+                executor.map(
+                    lambda point: self._render_point(
+                        point, IQ_mixing, include_readout, 1.0 / samplerate, dtype
+                    ),
+                    sweep_points,
+                )
+            )
+        return _stack_waveforms(waveforms, dtype)
+
+    def _render_point(
+        self,
+        variables: Dict[str, Any],
+        IQ_mixing: bool,
+        include_readout: bool,
+        timestep: float,
+        dtype: type,
+    ) -> Tuple[np.ndarray, np.ndarray, int]:
+        """
+        Renders the I and Q waveforms of the sequence for one set of variables.
+        The variables and render options have to be validated and the pulse table updated before.
+        """
+        # Single points are rendered pulse by pulse (with the compiled kernel if numba is available),
+        # as the setup of the batch kernel takes longer than the rendering itself
+        placed_pulses, total_length, readout_index = self._resolve_lengths(
+            timestep, variables
+        )
 
         # build the waveform of this sequence
-        full_waveform = np.zeros(0, dtype=np.complex128)
-        timestep = 1.0 / samplerate  # minimum time step
-        readout_index = 0  # index of the readout in the waveform of the whole sequence
-        position_of_next_slice = 0  # index where the next time slice will start
-        for time_slice in self._sequence:
-            # holds all waveforms that start at the same time (within the same slice)
-            wfm_slice = np.zeros(0, dtype=np.complex128)
-            # tracks the length of the last waveform in the slice as the next slice will start after that
-            last_wfm_length = 0
-            for pulse in time_slice:
-                # create waveform array of the current pulse
-                # adjust global phase relative to the beginning of the sequence
-                # (startphase is only relevant when IQ_mixing is True)
-                startphase = (
-                    2.0 * np.pi * pulse.iq_frequency * position_of_next_slice * timestep
-                )  # zero for homodyne mixing
-                wfm = pulse(
-                    samplerate,
-                    start_phase=startphase,
-                    heterodyne=IQ_mixing,
-                    **variables
+        # One additional sample at both ends makes sure the waveform starts and ends at 0
+        waveform_i = np.zeros(total_length + 2, dtype=dtype)
+        waveform_q = np.zeros(total_length + 2, dtype=dtype)
+        for row, (start, samples, length, pulse) in enumerate(placed_pulses):
+            if (
+                samples == 0
+                or (pulse.type == PulseType.Readout and not include_readout)
+                or not self._contributes(row, IQ_mixing)
+            ):
+                # Readout pulses are not taken into account here
+                continue
+            pulse_i = waveform_i[1 + start : 1 + start + samples]
+            pulse_q = waveform_q[1 + start : 1 + start + samples]
+            if pulse.is_parametrized:
+                self._add_pulse(
+                    row,
+                    pulse,
+                    start,
+                    samples,
+                    length,
+                    pulse.amplitude(**variables),
+                    timestep,
+                    IQ_mixing,
+                    pulse_i,
+                    pulse_q,
                 )
+            else:
+                fixed_i, fixed_q = self._fixed_pulse_waveform(
+                    row, pulse, start, samples, length, timestep, IQ_mixing, dtype
+                )
+                pulse_i += fixed_i
+                pulse_q += fixed_q
 
-                # if (pulse_dict["pulse"].type == PulseType.Readout) and (i == len(self._sequence) - 1):
-                #     # if readout is last, omit the wfm (apart from a single digit)
-                #     length = timestep
-
-                # Store index if this pulse is a readout pulse (will have the last one at the end)
-                if pulse.type == PulseType.Readout:
-                    readout_index = position_of_next_slice
-                    if not include_readout:
-                        # Readout pulses are not taken into account here
-                        wfm[:] = 0
-
-                # Store the size of the last waveform in a slice
-                # This waveform has skip=False and thus the next slice will start when this pulse is finished
-                # even if other pulses of the current slice are longer
-                last_wfm_length = len(wfm)
-
-                # Enlarge waveforms to be the same size
-                if len(wfm_slice) < len(wfm):
-                    wfm_slice.resize(len(wfm))
-                else:
-                    wfm.resize(len(wfm_slice))
-                # Add pulse to waveform of current time slice
-                wfm_slice += wfm
+        dc_corr = complex(self.dc_corr)
+        waveform_i[1:-1] += dc_corr.real
+        waveform_q[1:-1] += dc_corr.imag
+
+        return waveform_i, waveform_q, readout_index + 1  # +1 due to leading 0
+
+    def _sweep_points(
+        self, variables: Dict[str, List[float]]
+    ) -> Union[List[Dict[str, float]], None]:
+        """Splits lists of variable values into one dictionary of variables per sweep point."""
+        if self._variables != set(variables.keys()):
+            logging.error(
+                "Given function arguments do not match with required ones. "
+                + "The following keyword arguments are required: {}.".format(
+                    ", ".join(self._variables)
+                )
+            )
+            return None
+        sweep_lengths = {len(values) for values in variables.values()}
+        if len(sweep_lengths) > 1:
+            logging.error("Length of variable lists do not match.")
+            return None
+        sweep_length = sweep_lengths.pop() if sweep_lengths else 1
+        if sweep_length == 0:
+            logging.error(
+                "The lists containing values of the variables must not be empty."
+            )
+            return None
+        return [
+            {key: values[k] for key, values in variables.items()}
+            for k in range(sweep_length)
+        ]
 
-            # Resize waveform to be capable of holding current wfm_slice
-            new_waveform_length: float = max(
-                len(full_waveform), position_of_next_slice + len(wfm_slice)
+    @staticmethod
+    def _check_render_options(samplerate: float, dtype: type) -> bool:
+        """Logs an error and returns False if the sequence cannot be rendered with the given samplerate and dtype."""
+        if not samplerate:
+            logging.error("Sequence call requires samplerate.")
+            return False
+        if np.dtype(dtype) not in (np.dtype(np.float32), np.dtype(np.float64)):
+            logging.error(
+                "The dtype of the waveform has to be np.float32 or np.float64."
             )
-            full_waveform.resize(new_waveform_length)
-            # Add current time slice to global waveform
-            full_waveform[
-                position_of_next_slice : (position_of_next_slice + len(wfm_slice))
-            ] += wfm_slice
+            return False
+        return True
 
-            # Update position for next slice (the last waveform has no skip and thus decides the time)
-            position_of_next_slice += last_wfm_length
+    def _render_sweep_compiled(
+        self,
+        sweep_points: List[Dict[str, float]],
+        IQ_mixing: bool,
+        include_readout: bool,
+        timestep: float,
+        dtype: type = np.float64,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Renders the I and Q waveforms of all sweep points with the compiled kernels (requires numba).
+        The pulse lengths and amplitudes are resolved in python, the rendering itself runs without the GIL.
+        Several sweep points are rendered in parallel, a single one in the calling thread.
+        """
+        shape = (len(sweep_points), self._pulse_count)
+        starts = np.zeros(shape, dtype=np.int64)
+        sample_counts = np.zeros(shape, dtype=np.int64)
+        lengths = np.ones(shape)
+        amplitudes = np.zeros(shape)
+        shape_offsets = np.zeros(shape, dtype=np.int64)
+        total_lengths = np.zeros(len(sweep_points), dtype=np.int64)
+        readout_indices = np.zeros(len(sweep_points), dtype=np.int64)
+        custom_shapes: List[np.ndarray] = []
+        custom_offset = 0
+        for k, point in enumerate(sweep_points):
+            placed_pulses, total_lengths[k], readout_index = self._resolve_lengths(
+                timestep, point
+            )
+            readout_indices[k] = readout_index + 1  # +1 due to leading 0
+            for j, (start, samples, length, pulse) in enumerate(placed_pulses):
+                if samples == 0 or (
+                    pulse.type == PulseType.Readout and not include_readout
+                ):
+                    # Readout pulses are not taken into account here
+                    continue
+                starts[k, j] = start
+                sample_counts[k, j] = samples
+                lengths[k, j] = length
+                amplitudes[k, j] = pulse.amplitude(**point)
+                if self._pulse_table["shape_id"][j] == SHAPE_CUSTOM:
+                    custom_shapes.append(
+                        self._shape_samples(pulse, samples, length, timestep)
+                    )
+                    shape_offsets[k, j] = custom_offset
+                    custom_offset += samples
+
+        table = self._pulse_columns
+        dc_corr = complex(self.dc_corr)
+        # One additional sample at both ends makes sure the waveforms start and end at 0
+        waveform_i = np.zeros(
+            (len(sweep_points), total_lengths.max(initial=0) + 2), dtype=dtype
+        )
+        waveform_q = np.zeros_like(waveform_i)
+        shape_data = np.concatenate(custom_shapes) if custom_shapes else _NO_SAMPLES
+
+        mixing = IQ_mixing & (table["iq_frequency"] != 0)
+        # Pulses which only add zeros (i.e. waits) are skipped
+        sample_counts[:, (table["shape_id"] == SHAPE_ZERO) & ~mixing] = 0
+        kernel_args = (
+            table["shape_id"],
+            mixing,
+            table["iq_frequency"],
+            table["phase"],
+            table["iq_angle"],
+            table["q_rel"],
+            table["iq_dc_offset_re"],
+            table["iq_dc_offset_im"],
+            timestep,
+            dc_corr.real,
+            dc_corr.imag,
+        )
+        if shape[0] > 1:
+            _render_batch(
+                waveform_i,
+                waveform_q,
+                starts,
+                sample_counts,
+                lengths,
+                amplitudes,
+                shape_offsets,
+                shape_data,
+                total_lengths,
+                *kernel_args
+            )
+            return waveform_i, waveform_q, readout_indices
+
+        row_i = waveform_i[0, 1 : total_lengths[0] + 1]
+        row_q = waveform_q[0, 1 : total_lengths[0] + 1]
+        # Pulses with fixed length and amplitude are taken from the cache instead of the kernel
+        for j, pulse in enumerate(self._pulse_list):
+            samples = sample_counts[0, j]
+            if samples == 0 or pulse.is_parametrized:
+                continue
+            start = starts[0, j]
+            fixed_i, fixed_q = self._fixed_pulse_waveform(
+                j, pulse, start, samples, lengths[0, j], timestep, IQ_mixing, dtype
+            )
+            row_i[start : start + samples] += fixed_i
+            row_q[start : start + samples] += fixed_q
+            sample_counts[0, j] = 0
+        _render_row(
+            row_i,
+            row_q,
+            starts[0],
+            sample_counts[0],
+            lengths[0],
+            amplitudes[0],
+            shape_offsets[0],
+            shape_data,
+            *kernel_args
+        )
+        return waveform_i, waveform_q, readout_indices
 
-        full_waveform += self.dc_corr
+    def _contributes(self, row: int, IQ_mixing: bool) -> bool:
+        """False if the pulse in the given row of the pulse table only adds zeros (i.e. a wait)."""
+        return self._pulse_table["shape_id"][row] != SHAPE_ZERO or (
+            IQ_mixing and self._pulse_table["iq_frequency"][row] != 0
+        )
 
-        # make sure first and last point of the waveform go to 0
-        full_waveform = np.append(0, full_waveform)
-        full_waveform = np.append(full_waveform, 0)
+    def _add_pulse(
+        self,
+        row: int,
+        pulse: Pulse,
+        start: int,
+        samples: int,
+        length: float,
+        amplitude: float,
+        timestep: float,
+        IQ_mixing: bool,
+        out_i: np.ndarray,
+        out_q: np.ndarray,
+    ):
+        """
+        Adds the pulse in the given row of the pulse table to out_i and out_q, which hold exactly the samples of the pulse.
+        start is the index of the pulse in the sequence, it determines the global phase of the IQ modulation.
+        """
+        table = self._pulse_table
+        iq_frequency = table["iq_frequency"][row]
+        mixing = IQ_mixing and iq_frequency != 0
+        # adjust global phase relative to the beginning of the sequence
+        startphase = 2.0 * np.pi * iq_frequency * start * timestep
+        if numba_enable:
+            shape_id = table["shape_id"][row]
+            _render_pulse(
+                out_i,
+                out_q,
+                0,
+                samples,
+                shape_id,
+                self._shape_samples(pulse, samples, length, timestep)
+                if shape_id == SHAPE_CUSTOM
+                else _NO_SAMPLES,
+                float(amplitude),
+                length,
+                timestep,
+                mixing,
+                iq_frequency,
+                table["phase"][row] - startphase,
+                table["iq_angle"][row],
+                table["q_rel"][row],
+                table["iq_dc_offset_re"][row],
+                table["iq_dc_offset_im"][row],
+            )
+            return
+
+        envelope = amplitude * self._shape_samples(pulse, samples, length, timestep)
+        if mixing:
+            _add_modulated(
+                envelope,
+                timestep,
+                startphase,
+                iq_frequency,
+                table["phase"][row],
+                table["iq_angle"][row],
+                table["q_rel"][row],
+                complex(table["iq_dc_offset_re"][row], table["iq_dc_offset_im"][row]),
+                out_i,
+                out_q,
+            )
+        else:
+            out_i += envelope
 
-        if not any(np.iscomplex(full_waveform)):
-            # No complex information in there, so just return the real part
-            full_waveform = np.real(full_waveform)
+    def _fixed_pulse_waveform(
+        self,
+        row: int,
+        pulse: Pulse,
+        start: int,
+        samples: int,
+        length: float,
+        timestep: float,
+        IQ_mixing: bool,
+        dtype: type,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Returns the I and Q samples of a pulse with fixed length and amplitude.
+        They are cached, such that in a sweep only the pulses depending on the variables have to be calculated.
+        Pulses with IQ mixing are only reused at the same start index, as their phase depends on it.
+        The returned arrays must not be modified.
+        """
+        mixing = IQ_mixing and self._pulse_table["iq_frequency"][row] != 0
+        amplitude = pulse.amplitude()
+        key = (row, mixing, timestep, np.dtype(dtype))
+        # The length or amplitude of the pulse might have been replaced since it was cached
+        placement = (start if mixing else 0, samples, length, amplitude)
+        cached = self._pulse_cache.get(key)
+        if cached is not None and cached[0] == placement:
+            return cached[1], cached[2]
+
+        fixed_i = np.zeros(samples, dtype=dtype)
+        fixed_q = np.zeros(samples, dtype=dtype)
+        self._add_pulse(
+            row,
+            pulse,
+            start,
+            samples,
+            length,
+            amplitude,
+            timestep,
+            IQ_mixing,
+            fixed_i,
+            fixed_q,
+        )
+        self._pulse_cache[key] = (placement, fixed_i, fixed_q)
+        return fixed_i, fixed_q
+
+    def _resolve_lengths(
+        self, timestep: float, variables: Dict[str, Any]
+    ) -> Tuple[List[Tuple[int, int, float, Pulse]], int, int]:
+        """
+        Resolves the lengths of all pulses for the given variables.
 
-        return full_waveform, readout_index + 1  # +1 due to leading 0
+        Returns:
+            placed_pulses: list of (start index, number of samples, length, pulse) for every pulse in the sequence
+            total_length:  number of samples of the whole sequence
+            readout_index: index of the (last) readout in the sequence
+        """
+        readout_index = 0  # index of the readout in the waveform of the whole sequence
+        position = 0  # index where the current time slice starts
+        previous_samples = 0
+        total_length = 0
+        placed_pulses: List[Tuple[int, int, float, Pulse]] = []
+        for pulse, parallel in zip(
+            self._pulse_list,
+            self._pulse_table["parallel"][: self._pulse_count].tolist(),
+        ):
+            if not parallel:
+                # The previous pulse was the last one of its slice and has skip=False,
+                # thus the next slice starts when this pulse is finished even if other pulses of the slice are longer
+                position += previous_samples
+            length = pulse.length(**variables)
+            samples = pulse.sample_count(length, timestep)
+            # Store index if this pulse is a readout pulse (will have the last one at the end)
+            if pulse.type == PulseType.Readout:
+                readout_index = position
+            placed_pulses.append((position, samples, length, pulse))
+            total_length = max(total_length, position + samples)
+            previous_samples = samples
+        return placed_pulses, total_length, readout_index
+
+    def _shape_samples(
+        self, pulse: Pulse, samples: int, length: float, timestep: float
+    ) -> np.ndarray:
+        """
+        Returns the shape of the pulse evaluated at its samples for the given length.
+        Results are cached for pulses with fixed length, as the same pulses are usually rendered many times
+        (i.e. in parameter sweeps). Every point of a length sweep would be a new entry,
+        and rect and zero are evaluated faster than they are looked up.
+        The returned array must not be modified.
+        """
+        shape = pulse.shape
+        if pulse.length.is_parametrized or shape._kernel_id in (SHAPE_ZERO, SHAPE_RECT):
+            return shape(_time_fractions(samples, length, timestep))
+
+        key = (shape, samples, length, timestep)
+        shape_samples = self._shape_cache.get(key)
+        if shape_samples is None:
+            shape_samples = shape(_time_fractions(samples, length, timestep))
+            with self._cache_lock:
+                if key not in self._shape_cache:
+                    self._shape_cache[key] = shape_samples
+                    self._shape_cache_bytes += shape_samples.nbytes
+                while self._shape_cache_bytes > _SHAPE_CACHE_BYTES:
+                    # Drop the oldest entries
+                    oldest = self._shape_cache.pop(next(iter(self._shape_cache)))
+                    self._shape_cache_bytes -= oldest.nbytes
+        return shape_samples
 
     def add(self, pulse: Pulse, skip: bool = False):
         """
@@ -462,17 +1346,73 @@ class PulseSequence(object):
             # Keep track of all variable names: Add them to a set of unique variable names
             self._variables.update(pulse.variable_names)
 
-        if not self._next_pulse_is_parallel:
-            # Add empty list for next pulse
-            self._sequence.append([])
-        # Add pulse to last sequence slice
-        self._sequence[-1].append(pulse)
+        self._pulse_list.append(pulse)
+        self._append_to_table(pulse)
 
         # If skip is true the next pulse will be scheduled at the same time
         self._next_pulse_is_parallel = skip
 
         return self
 
+    def _append_to_table(self, pulse: Pulse):
+        """Stores the properties of a newly added pulse in the pulse table."""
+        if self._pulse_count == len(self._pulse_table["shape_id"]):
+            for column, values in self._pulse_table.items():
+                self._pulse_table[column] = np.concatenate(
+                    (values, np.zeros_like(values))
+                )
+        row = self._pulse_count
+        self._pulse_table["parallel"][row] = self._next_pulse_is_parallel
+        self._row_properties.append(None)
+        self._write_table_row(row, pulse)
+        self._pulse_count += 1
+
+    def _write_table_row(self, row: int, pulse: Pulse):
+        """Stores the shape and IQ properties of the pulse in the given row of the pulse table."""
+        iq_dc_offset = complex(pulse.iq_dc_offset)
+        self._pulse_table["shape_id"][row] = pulse.shape._kernel_id
+        self._pulse_table["iq_frequency"][row] = pulse.iq_frequency
+        self._pulse_table["phase"][row] = np.pi / 180 * pulse.phase
+        self._pulse_table["iq_angle"][row] = pulse.iq_angle
+        self._pulse_table["q_rel"][row] = pulse.q_rel
+        self._pulse_table["iq_dc_offset_re"][row] = iq_dc_offset.real
+        self._pulse_table["iq_dc_offset_im"][row] = iq_dc_offset.imag
+        self._row_properties[row] = self._table_properties(pulse)
+
+    @staticmethod
+    def _table_properties(pulse: Pulse) -> Tuple:
+        """Returns the properties of a pulse which are copied into the pulse table."""
+        return (
+            pulse.shape,
+            pulse.iq_frequency,
+            pulse.phase,
+            pulse.iq_angle,
+            pulse.q_rel,
+            pulse.iq_dc_offset,
+        )
+
+    def _update_pulse_table(self):
+        """
+        Rewrites the rows of the pulse table whose pulses were changed after they were added,
+        such that the rendered waveforms always follow the current pulse objects.
+        """
+        for row, pulse in enumerate(self._pulse_list):
+            if self._table_properties(pulse) == self._row_properties[row]:
+                continue
+            with self._cache_lock:
+                self._write_table_row(row, pulse)
+                # Drop the rendered samples of the changed pulse
+                for key in [key for key in self._pulse_cache if key[0] == row]:
+                    del self._pulse_cache[key]
+
+    @property
+    def _pulse_columns(self) -> Dict[str, np.ndarray]:
+        """The valid part of the pulse table."""
+        return {
+            column: values[: self._pulse_count]
+            for column, values in self._pulse_table.items()
+        }
+
     def add_wait(self, time: ParametrizedValue.Type, name: str = None):
         """
         Add a wait time to the sequence.
@@ -500,10 +1440,10 @@ class PulseSequence(object):
 
         if name is None:
             # Find a unused name for the next wait "pulse"
-            wait_index = 0
-            while compose_name(wait_index) in self._pulses:
-                wait_index += 1
-            name = compose_name(wait_index)
+            # (continue counting from the last generated name instead of starting at 0)
+            while compose_name(self._wait_count) in self._pulses:
+                self._wait_count += 1
+            name = compose_name(self._wait_count)
 
         wait_pulse = Pulse(time, shape=ShapeLib.zero, name=name, ptype=PulseType.Wait)
         return self.add(wait_pulse)
@@ -530,10 +1470,10 @@ class PulseSequence(object):
 
         if pulse is None:
             # Find a unused name for the next readout pulse
-            readout_index = 0
-            while compose_name(readout_index) in self._pulses:
-                readout_index += 1
-            name = compose_name(readout_index)
+            # (continue counting from the last generated name instead of starting at 0)
+            while compose_name(self._readout_count) in self._pulses:
+                self._readout_count += 1
+            name = compose_name(self._readout_count)
 
             # Try to determine useful readout tone length
             try:
@@ -568,7 +1508,7 @@ class PulseSequence(object):
         The properties of each pulse are stored in a dictionary with keys: name, shape, length, skip value
         """
         dict_list: List[Dict[str, Any]] = []
-        for time_slice in self._sequence:
+        for time_slice in self.sequence:
             for i, pulse in enumerate(time_slice):
                 # This is more for legacy reasons
                 dict_list.append(
@@ -591,7 +1531,14 @@ class PulseSequence(object):
     @property
     def sequence(self) -> List[List[Pulse]]:
         """A List of Lists containing pulses. If pulses are paralles they will be in the same sublist"""
-        return self._sequence
+        time_slices: List[List[Pulse]] = []
+        for pulse, parallel in zip(
+            self._pulse_list, self._pulse_columns["parallel"].tolist()
+        ):
+            if not parallel:
+                time_slices.append([])
+            time_slices[-1].append(pulse)
+        return time_slices
 
     def plot(self):
         """
@@ -606,7 +1553,8 @@ class PulseSequence(object):
         remaining_colors = self._color_palette[:]
         pulse_colors: Dict[str, str] = {}
 
-        for i, time_slice in enumerate(self._sequence):
+        time_slices = self.sequence
+        for i, time_slice in enumerate(time_slices):
             for amp, pulse in enumerate(reversed(time_slice)):
                 ampmax = max(ampmax, amp + 1)
 
@@ -652,11 +1600,11 @@ class PulseSequence(object):
                 )
 
         # make sure plot looks nice and fits on the screen (max number of pulses before scaling down is 9)
-        size = 2.0 * min(1.0, 9.0 / len(self._sequence))
+        size = 2.0 * min(1.0, 9.0 / len(time_slices))
         fig.set_figheight(size * ampmax)
-        fig.set_figwidth(size * (len(self._sequence) - 1) + 2.0)
+        fig.set_figwidth(size * (len(time_slices) - 1) + 2.0)
         ax.set_xlabel("pulse number")
-        ax.set_xticks(np.arange(len(self._sequence)))
+        ax.set_xticks(np.arange(len(time_slices)))
         plt.xlim(
             -0.05,
         )